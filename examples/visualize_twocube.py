@@ -14,6 +14,25 @@ import pyvista as pv
 from pyvista_cityjson import CityJSONReader
 
 
+def export_view(
+    plotter: pv.Plotter,
+    reader: CityJSONReader,
+    color_by: str,
+    title: str,
+    filename: str,
+) -> None:
+    """Color the city model by a cell array and export the scene to HTML.
+
+    The model is added under a fixed name, so each view replaces the
+    previous one, together with its scalar bar, in the same plotter.
+    """
+    reader.add_to_plotter(plotter, color_by=color_by, name="city")
+    plotter.camera_position = "iso"
+    plotter.add_title(title)
+    plotter.export_html(filename)
+    sys.stdout.write(f"Visualization exported to: {Path(filename).resolve()}\n")
+
+
 def main() -> None:
     """Run the main visualization example."""
     # Change to examples directory if running from parent directory
@@ -34,55 +53,22 @@ def main() -> None:
 
     reader = CityJSONReader(cityjson_file)
 
-    # Get the complete mesh
-    mesh = reader.mesh
-
-    # Create a plotter for visualization
+    # Create a single plotter; every view below is exported from it
     plotter = pv.Plotter(window_size=(1024, 768))
-    plotter.add_mesh(mesh, show_edges=True, color="lightblue")
-    plotter.add_title("Two Cubes CityJSON Visualization")
 
-    # Add lighting and camera settings for better visualization
+    # Add lighting for better visualization
     plotter.add_light(pv.Light(position=(10, 10, 10)))
-    plotter.camera_position = "iso"
 
-    # Export to HTML
-    output_file = "twocube_visualization.html"
-    plotter.export_html(output_file)
-    output_path = Path(output_file).resolve()
-    sys.stdout.write(f"Main visualization exported to: {output_path}\n")
-
-    # Example: Filter buildings only
-    buildings = reader.filter_by_type("Building")
-    if buildings is not None:
-        sys.stdout.write(f"Found {buildings.n_cells} building cells\n")
-
-        # Create a separate plot for buildings only
-        building_plotter = pv.Plotter(window_size=(1024, 768))
-        building_plotter.add_mesh(buildings, show_edges=True, color="orange")
-        building_plotter.add_title("Buildings Only")
-        building_plotter.camera_position = "iso"
-        buildings_file = "buildings_only.html"
-        building_plotter.export_html(buildings_file)
-        buildings_path = Path(buildings_file).resolve()
-        sys.stdout.write(f"Buildings visualization exported to: {buildings_path}\n")
-
-    # Example: Color by semantic surfaces
-    try:
-        colored_mesh = reader.color_by_surface()
-        if colored_mesh is not None:
-            surface_plotter = pv.Plotter(window_size=(1024, 768))
-            surface_plotter.add_mesh(colored_mesh, show_edges=True)
-            surface_plotter.add_title("Colored by Semantic Surfaces")
-            surface_plotter.camera_position = "iso"
-            surfaces_file = "semantic_surfaces.html"
-            surface_plotter.export_html(surfaces_file)
-            surfaces_path = Path(surfaces_file).resolve()
-            sys.stdout.write(
-                f"Semantic surfaces visualization exported to: {surfaces_path}\n"
-            )
-    except Exception as e:  # noqa: BLE001
-        sys.stderr.write(f"Could not color by surfaces: {e}\n")
+    export_view(
+        plotter,
+        reader,
+        "object_type",
+        "Two Cubes CityJSON Visualization",
+        "twocube_visualization.html",
+    )
+    export_view(
+        plotter, reader, "object_id", "Colored by City Object", "city_objects.html"
+    )
 
 
 if __name__ == "__main__":
@@ -5,20 +5,534 @@ Loads CityJSON files and converts them to PyVista meshes for visualization.
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import json
+import os
+import zipfile
+from array import array
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
+from platformdirs import user_cache_dir
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import pyvista as pv
 
 try:
     import pyvista as pv
+    from vtkmodules.util.numpy_support import numpy_to_vtkIdTypeArray
+    from vtkmodules.vtkCommonDataModel import vtkCellArray
 except ImportError:
     pv = None
 
+try:
+    import orjson
+except ImportError:
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
+# Faces with fewer vertices than this are skipped
+_MIN_FACE_VERTICES = 3
+
+# Bump when the layout of cached geometry changes
+_CACHE_VERSION = 1
+
+# Errors raised by np.load for missing, truncated or corrupt cache files
+_CACHE_ERRORS = (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile)
+
+
+def _dequantize(vertices: list, transform: dict | None) -> np.ndarray:
+    """Convert CityJSON vertices to real-world coordinates.
+
+    Parameters
+    ----------
+    vertices : list
+        ``[x, y, z]`` vertex coordinates, integers when ``transform`` is set.
+    transform : dict or None
+        CityJSON ``transform`` object with ``scale`` and ``translate``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(n, 3)`` float64 array of vertex coordinates.
+
+    """
+    points = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    if transform:
+        points *= np.asarray(transform["scale"], dtype=np.float64)
+        points += np.asarray(transform["translate"], dtype=np.float64)
+    return points
+
+
+def _polydata_from_faces(
+    points: np.ndarray, lens: np.ndarray, idx: np.ndarray
+) -> pv.PolyData:
+    """Build a PolyData from face lengths and flat vertex indices.
+
+    The offsets and connectivity arrays are handed to ``vtkCellArray``
+    without copying, so VTK does not have to parse a packed faces array.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(n, 3)`` point coordinates.
+    lens : numpy.ndarray
+        Number of vertices of each face.
+    idx : numpy.ndarray
+        Vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    pyvista.PolyData
+        Mesh with one polygon per face.
+
+    """
+    offsets = np.zeros(len(lens) + 1, dtype=pv.ID_TYPE)
+    np.cumsum(lens, out=offsets[1:])
+    connectivity = np.ascontiguousarray(idx, dtype=pv.ID_TYPE)
+
+    polys = vtkCellArray()
+    polys.SetData(
+        numpy_to_vtkIdTypeArray(offsets), numpy_to_vtkIdTypeArray(connectivity)
+    )
+    mesh = pv.PolyData()
+    mesh.points = points
+    mesh.SetPolys(polys)
+    return mesh
+
+
+def _convex_faces(points: np.ndarray, lens: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Find faces whose outer ring is convex.
+
+    A ring is convex when every corner turns the same way as the face
+    normal, which is computed with Newell's method.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(n, 3)`` point coordinates.
+    lens : numpy.ndarray
+        Number of vertices of each face.
+    idx : numpy.ndarray
+        Vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask that is ``True`` for convex faces.
+
+    """
+    starts = np.cumsum(lens) - lens
+    face = np.repeat(np.arange(len(lens)), lens)
+    corner = np.arange(len(idx)) - starts[face]
+    nxt = starts[face] + (corner + 1) % lens[face]
+    prv = starts[face] + (corner - 1) % lens[face]
+
+    # Work relative to the first vertex of each face to keep precision on
+    # georeferenced coordinates
+    rel = points[idx] - points[idx[starts]][face]
+    normals = np.add.reduceat(np.cross(rel, rel[nxt]), starts)
+    turns = np.cross(rel - rel[prv], rel[nxt] - rel)
+    return np.logical_and.reduceat(
+        np.einsum("ij,ij->i", turns, normals[face]) >= 0, starts
+    )
+
+
+def _fan_triangulate(
+    lens: np.ndarray, idx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fan-triangulate convex faces.
+
+    Returns the ``(m, 3)`` triangle vertex indices and the index of the face
+    each triangle was cut from.
+    """
+    n_tris = lens - 2
+    parent = np.repeat(np.arange(len(lens)), n_tris)
+    starts = np.repeat(np.cumsum(lens) - lens, n_tris)
+    corner = np.arange(len(parent)) - np.repeat(np.cumsum(n_tris) - n_tris, n_tris)
+    tris = np.column_stack(
+        (idx[starts], idx[starts + corner + 1], idx[starts + corner + 2])
+    )
+    return tris, parent
+
+
+def _triangulate(
+    points: np.ndarray, lens: np.ndarray, idx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Triangulate polygonal faces.
+
+    Convex faces are fan-triangulated with NumPy. Concave faces, such as
+    L- or U-shaped footprints, are triangulated by VTK.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(n, 3)`` point coordinates.
+    lens : numpy.ndarray
+        Number of vertices of each face.
+    idx : numpy.ndarray
+        Vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Face lengths (all 3) and vertex indices of the triangles, and the
+        index of the face each triangle was cut from.
+
+    """
+    convex = _convex_faces(points, lens, idx)
+    tris, parent = _fan_triangulate(lens[convex], idx[np.repeat(convex, lens)])
+    parent = np.flatnonzero(convex)[parent]
+
+    concave = ~convex
+    if concave.any():
+        polygons = _polydata_from_faces(
+            points, lens[concave], idx[np.repeat(concave, lens)]
+        )
+        polygons.cell_data["face"] = np.flatnonzero(concave)
+        triangles = polygons.triangulate()
+        tris = np.concatenate((tris, triangles.faces.reshape(-1, 4)[:, 1:]))
+        parent = np.concatenate((parent, triangles.cell_data["face"]))
+
+        # Restore the original face order
+        order = np.argsort(parent, kind="stable")
+        tris = tris[order]
+        parent = parent[order]
+
+    return np.full(len(parent), 3, dtype=np.int32), tris.ravel(), parent
+
+
+def _optimize_vertices(
+    points: np.ndarray, idx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge coincident vertices and order them by first use.
+
+    Points that are referenced together end up next to each other in memory,
+    which is what meshoptimizer's vertex fetch optimization does.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(n, 3)`` point coordinates.
+    idx : numpy.ndarray
+        Vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Reordered points, without duplicates or unreferenced points, and
+        the remapped vertex indices.
+
+    """
+    unique_points, merged = np.unique(points, axis=0, return_inverse=True)
+    idx = merged.ravel()[idx]
+
+    used, first_use = np.unique(idx, return_index=True)
+    order = used[np.argsort(first_use)]
+    new_ids = np.empty(len(unique_points), dtype=np.int32)
+    new_ids[order] = np.arange(len(order), dtype=np.int32)
+    return unique_points[order], new_ids[idx]
+
+
+def _exterior_faces(lens: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Find faces that are not shared with another face.
+
+    Two faces are considered shared when they reference the same set of
+    vertex indices, regardless of orientation or starting vertex.
+
+    Parameters
+    ----------
+    lens : numpy.ndarray
+        Number of vertices of each face.
+    idx : numpy.ndarray
+        Vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask that is ``True`` for faces that occur only once.
+
+    """
+    keep = np.ones(len(lens), dtype=bool)
+    starts = np.cumsum(lens) - lens
+    # Only faces with the same number of vertices can coincide
+    for n_vertices in np.unique(lens):
+        (faces,) = np.nonzero(lens == n_vertices)
+        keys = np.sort(idx[starts[faces, None] + np.arange(n_vertices)], axis=1)
+        _, inverse, counts = np.unique(
+            keys, axis=0, return_inverse=True, return_counts=True
+        )
+        keep[faces] = counts[inverse.ravel()] == 1
+    return keep
+
+
+def _append_rings(rings: Iterable[list[int]], lens: array, idx: array) -> int:
+    """Append rings with enough vertices to the face buffers.
+
+    Returns the number of faces appended.
+    """
+    n_faces = 0
+    for ring in rings:
+        if len(ring) >= _MIN_FACE_VERTICES:
+            lens.append(len(ring))
+            idx.extend(ring)
+            n_faces += 1
+    return n_faces
+
+
+def _outer_rings(surfaces: list) -> Iterable[list[int]]:
+    """Iterate over the outer ring of each surface, assuming lists of rings.
+
+    No per-surface type checks are made, so a bare ring among the surfaces
+    makes the consumer raise ``TypeError``; see :func:`_append_outer_rings`.
+    """
+    return (surface[0] for surface in surfaces if surface)
+
+
+def _outer_rings_checked(surfaces: list) -> Iterable[list[int]]:
+    """Iterate over the outer ring of each surface, inspecting every surface.
+
+    Each surface may be a list of rings or a bare ring.
+    """
+    return (
+        surface[0] if isinstance(surface[0], list) else surface
+        for surface in surfaces
+        if isinstance(surface, list) and surface
+    )
+
+
+def _append_outer_rings(surfaces: list, lens: array, idx: array) -> int:
+    """Append the outer ring of each surface to the face buffers.
+
+    Surfaces are normally lists of rings. That layout is recognized from the
+    first surface and the rest are taken without type checks. If a later
+    surface turns out to be a bare ring, the faces appended so far are
+    dropped and the surfaces are read again with per-surface checks.
+
+    Returns the number of faces appended.
+    """
+    first = surfaces[0] if surfaces else None
+    if isinstance(first, list) and first and isinstance(first[0], list):
+        n_lens, n_idx = len(lens), len(idx)
+        try:
+            return _append_rings(_outer_rings(surfaces), lens, idx)
+        except TypeError:
+            del lens[n_lens:]
+            del idx[n_idx:]
+    return _append_rings(_outer_rings_checked(surfaces), lens, idx)
+
+
+def _extract_solid_faces(boundaries: list, lens: array, idx: array) -> int:
+    """Extract faces from Solid geometry."""
+    return sum(_append_outer_rings(shell, lens, idx) for shell in boundaries)
+
+
+def _extract_surface_faces(boundaries: list, lens: array, idx: array) -> int:
+    """Extract faces from MultiSurface/CompositeSurface geometry."""
+    return _append_outer_rings(boundaries, lens, idx)
+
+
+def _extract_faces_from_geometry(geometry: dict, lens: array, idx: array) -> int:
+    """Extract face indices from CityJSON geometry into the face buffers.
+
+    Returns the number of faces appended.
+    """
+    geom_type = geometry.get("type", "")
+    boundaries = geometry.get("boundaries", [])
+
+    if geom_type == "Solid":
+        return _extract_solid_faces(boundaries, lens, idx)
+    if geom_type in {"MultiSurface", "CompositeSurface"}:
+        return _extract_surface_faces(boundaries, lens, idx)
+    return 0
+
+
+def _extract_city_objects(
+    city_objects: list[tuple[str, dict]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str], list[str]]:
+    """Extract the faces of city objects into flat index buffers.
+
+    Parameters
+    ----------
+    city_objects : list of tuple
+        ``(id, object)`` pairs taken from the ``CityObjects`` mapping.
+
+    Returns
+    -------
+    tuple
+        Face lengths, flat vertex indices, per-face object type index and
+        per-face object id index, followed by the type and id lookup tables.
+
+    """
+    lens = array("i")
+    idx = array("i")
+
+    # Per-face object type and id are stored as indices into lookup tables.
+    # Only one entry per object and per geometry is recorded while walking
+    # the objects; the per-face arrays are expanded once at the end.
+    type_to_idx: dict[str, int] = {}
+    id_names: list[str] = []
+    obj_type_idx = array("i")
+    geom_obj_idx = array("i")
+    geom_n_faces = array("i")
+
+    for obj_id, obj_data in city_objects:
+        obj_type = obj_data.get("type", "Unknown")
+        geometries = obj_data.get("geometry", [])
+        obj_type_idx.append(type_to_idx.setdefault(obj_type, len(type_to_idx)))
+        obj_idx = len(id_names)
+        id_names.append(obj_id)
+
+        for geom in geometries:
+            geom_n_faces.append(_extract_faces_from_geometry(geom, lens, idx))
+            geom_obj_idx.append(obj_idx)
+
+    id_idx = np.repeat(
+        np.frombuffer(geom_obj_idx, dtype=np.int32),
+        np.frombuffer(geom_n_faces, dtype=np.int32),
+    )
+    return (
+        np.frombuffer(lens, dtype=np.int32),
+        np.frombuffer(idx, dtype=np.int32),
+        np.frombuffer(obj_type_idx, dtype=np.int32)[id_idx],
+        id_idx,
+        list(type_to_idx),
+        id_names,
+    )
+
+
+def _merge_extracted(
+    results: Iterable[
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str], list[str]]
+    ],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str], list[str]]:
+    """Concatenate separately extracted city objects.
+
+    Each result is a tuple as returned by :func:`_extract_city_objects`,
+    e.g. one per CityJSONSeq feature.
+    Their lookup indices are remapped onto merged type and id tables.
+    """
+    type_to_idx: dict[str, int] = {}
+    id_names: list[str] = []
+    lens = [np.empty(0, dtype=np.int32)]
+    idx = [np.empty(0, dtype=np.int32)]
+    type_idx = [np.empty(0, dtype=np.int32)]
+    id_idx = [np.empty(0, dtype=np.int32)]
+    for part_lens, part_idx, part_type_idx, part_id_idx, types, ids in results:
+        remap = np.array(
+            [type_to_idx.setdefault(t, len(type_to_idx)) for t in types],
+            dtype=np.int32,
+        )
+        lens.append(part_lens)
+        idx.append(part_idx)
+        type_idx.append(remap[part_type_idx])
+        id_idx.append(part_id_idx + len(id_names))
+        id_names.extend(ids)
+
+    return (
+        np.concatenate(lens),
+        np.concatenate(idx),
+        np.concatenate(type_idx),
+        np.concatenate(id_idx),
+        list(type_to_idx),
+        id_names,
+    )
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding cached geometry."""
+    return Path(user_cache_dir("pyvista-cityjson"))
+
+
+def _cache_file(filename: str | Path) -> Path:
+    """Return the cache file for a CityJSON file.
+
+    The name only depends on the resolved path, so a file has at most one
+    cache entry that is overwritten when the file changes.
+    """
+    path = str(Path(filename).resolve())
+    return _cache_dir() / f"{hashlib.sha256(path.encode()).hexdigest()}.npz"
+
+
+def _source_stamp(filename: str | Path) -> np.ndarray:
+    """Return the cache version, modification time and size of a file."""
+    try:
+        stat = Path(filename).stat()
+    except FileNotFoundError as e:
+        msg = f"File not found: {filename}"
+        raise FileNotFoundError(msg) from e
+    return np.array([_CACHE_VERSION, stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+
+def _save_cache(
+    cache_file: Path, stamp: np.ndarray, vertices: np.ndarray, extracted: tuple
+) -> None:
+    """Write extracted geometry to a cache file.
+
+    The cache is only a speedup, so failures to write it, e.g. because the
+    cache directory is read-only or the disk is full, are ignored.
+    """
+    lens, idx, type_idx, id_idx, type_names, id_names = extracted
+    # Write to a temporary file first so readers never see a partial cache
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open("wb") as f:
+            np.savez(
+                f,
+                stamp=stamp,
+                vertices=vertices,
+                lens=lens,
+                idx=idx,
+                type_idx=type_idx,
+                id_idx=id_idx,
+                type_names=np.array(type_names, dtype=str),
+                id_names=np.array(id_names, dtype=str),
+            )
+        tmp_file.replace(cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+
+
+def _cache_is_fresh(cache_file: Path, stamp: np.ndarray) -> bool:
+    """Check whether a cache file was written for the current source file.
+
+    Only the stamp is read, so this is cheap even for large caches.
+    """
+    try:
+        with np.load(cache_file) as arrays:
+            return np.array_equal(arrays["stamp"], stamp)
+    except _CACHE_ERRORS:
+        return False
+
+
+def _load_cache(cache_file: Path, stamp: np.ndarray) -> tuple | None:
+    """Read extracted geometry written by :func:`_save_cache`.
+
+    Returns ``None`` when the cache is missing, stale or unreadable.
+    """
+    try:
+        with np.load(cache_file) as arrays:
+            if not np.array_equal(arrays["stamp"], stamp):
+                return None
+            return arrays["vertices"], (
+                arrays["lens"],
+                arrays["idx"],
+                arrays["type_idx"],
+                arrays["id_idx"],
+                arrays["type_names"].tolist(),
+                arrays["id_names"].tolist(),
+            )
+    except _CACHE_ERRORS:
+        return None
+
 
 class CityJSONReader:
     """Reader for CityJSON files that converts geometries to PyVista meshes.
@@ -27,16 +541,48 @@ class CityJSONReader:
     ----------
     filename : str
         Path to the CityJSON file
+    triangulate : bool, default: False
+        Split polygonal faces into triangles when building the mesh
+    skin : bool, default: False
+        Drop interior faces shared by adjacent solids when building the mesh
+    cache : bool, default: False
+        Cache the extracted geometry on disk, keyed by file modification time
+    optimize : bool, default: False
+        Merge coincident vertices and order points by first use
 
     """
 
-    def __init__(self, filename: str | Path) -> None:
+    def __init__(
+        self,
+        filename: str | Path,
+        *,
+        triangulate: bool = False,
+        skin: bool = False,
+        cache: bool = False,
+        optimize: bool = False,
+    ) -> None:
         """Initialize the CityJSON reader.
 
         Parameters
         ----------
         filename : str | Path
             Path to the CityJSON file to read.
+        triangulate : bool, default: False
+            Fan-triangulate polygonal faces once at load time so the mesh
+            only contains triangles.
+        skin : bool, default: False
+            Keep only exterior faces. Faces that occur more than once, such
+            as walls shared by adjacent solids, are removed before the mesh
+            is built.
+        cache : bool, default: False
+            Store the extracted geometry in the user cache directory and
+            reuse it while the file is unchanged. On a cache hit the JSON is
+            only parsed if :attr:`data` is accessed.
+        optimize : bool, default: False
+            Merge vertices with identical coordinates, drop unreferenced
+            vertices and store points in the order faces first use them,
+            which improves memory locality when rendering. Point ids of the
+            mesh then no longer match the vertex indices of :attr:`data`.
 
         Raises
         ------
@@ -46,20 +592,166 @@ class CityJSONReader:
             If the file is not a valid CityJSON file.
 
         """
+        self._init_state(
+            filename,
+            triangulate=triangulate,
+            skin=skin,
+            cache=cache,
+            optimize=optimize,
+        )
+        if self._cache_file is None or not _cache_is_fresh(
+            self._cache_file, self._cache_stamp
+        ):
+            self._load_file()
+
+    @classmethod
+    def from_seq(
+        cls,
+        filename: str | Path,
+        *,
+        triangulate: bool = False,
+        skin: bool = False,
+        cache: bool = False,
+        optimize: bool = False,
+    ) -> CityJSONReader:
+        """Create a reader for a CityJSONSeq file.
+
+        CityJSONSeq (``.city.jsonl``) stores a CityJSON header on the first
+        line followed by one ``CityJSONFeature`` per line. Only the header
+        is read here; features are parsed one line at a time when the mesh
+        is built, so the whole document is never held in memory.
+
+        Parameters
+        ----------
+        filename : str | Path
+            Path to the CityJSONSeq file to read.
+        triangulate : bool, default: False
+            Fan-triangulate polygonal faces, see :class:`CityJSONReader`.
+        skin : bool, default: False
+            Keep only exterior faces, see :class:`CityJSONReader`.
+        cache : bool, default: False
+            Cache the extracted geometry on disk, see :class:`CityJSONReader`.
+        optimize : bool, default: False
+            Optimize the vertex order, see :class:`CityJSONReader`.
+
+        Returns
+        -------
+        CityJSONReader
+            Reader whose :attr:`data` is the CityJSONSeq header.
+
+        Raises
+        ------
+        ImportError
+            If PyVista is not installed.
+        ValueError
+            If the file is not a valid CityJSONSeq file.
+        FileNotFoundError
+            If the specified file does not exist.
+
+        """
+        reader = cls.__new__(cls)
+        reader._init_state(  # noqa: SLF001
+            filename,
+            triangulate=triangulate,
+            skin=skin,
+            cache=cache,
+            optimize=optimize,
+        )
+        reader._load_seq_header()  # noqa: SLF001
+        return reader
+
+    def _init_state(
+        self,
+        filename: str | Path,
+        *,
+        triangulate: bool,
+        skin: bool,
+        cache: bool,
+        optimize: bool,
+    ) -> None:
+        """Set up the reader attributes shared by all constructors."""
         if pv is None:
             msg = "PyVista is required. Install with: pip install pyvista"
             raise ImportError(msg)
 
         self.filename = filename
+        self.triangulate = triangulate
+        self.skin = skin
+        self.optimize = optimize
         self._data = None
-        self._mesh = None
-        self._load_file()
+        self._is_seq = False
+        self._cache_file = _cache_file(filename) if cache else None
+        self._cache_stamp = _source_stamp(filename) if cache else None
+        self._lens = np.array([], dtype=np.int32)
+        self._idx = np.array([], dtype=np.int32)
+        self._type_names = np.array([], dtype=str)
+        self._object_ids = np.array([], dtype=str)
+
+    def _load_seq_header(self) -> None:
+        """Load and validate the header line of a CityJSONSeq file."""
+        try:
+            with Path(self.filename).open("rb") as f:
+                self._data = _json_loads(f.readline())
+        except FileNotFoundError as e:
+            msg = f"File not found: {self.filename}"
+            raise FileNotFoundError(msg) from e
+        except json.JSONDecodeError as e:
+            msg = f"Invalid JSON file: {self.filename}"
+            raise ValueError(msg) from e
+
+        if self._data.get("type") != "CityJSON":
+            msg = f"Invalid CityJSONSeq file: {self.filename}"
+            raise ValueError(msg)
+        self._is_seq = True
+
+    def _iter_seq_features(self) -> Iterator[dict]:
+        """Parse the features of a CityJSONSeq file one line at a time."""
+        with Path(self.filename).open("rb") as f:
+            f.readline()
+            for line_number, line in enumerate(f, start=2):
+                if not line.strip():
+                    continue
+                try:
+                    feature = _json_loads(line)
+                except json.JSONDecodeError as e:
+                    msg = f"Invalid JSON on line {line_number}: {self.filename}"
+                    raise ValueError(msg) from e
+                if feature.get("type") != "CityJSONFeature":
+                    msg = (
+                        f"Invalid CityJSONFeature on line {line_number}: "
+                        f"{self.filename}"
+                    )
+                    raise ValueError(msg)
+                yield feature
+
+    def _extract_seq(self) -> tuple[np.ndarray, tuple]:
+        """Extract vertices and faces from the features of a CityJSONSeq file.
+
+        Feature vertex indices are local to each feature and are offset by
+        the number of vertices read so far.
+        """
+        transform = self._data.get("transform")
+        vertices = [np.empty((0, 3))]
+        n_vertices = 0
+
+        def extract_features() -> Iterator[tuple]:
+            nonlocal n_vertices
+            for feature in self._iter_seq_features():
+                points = _dequantize(feature.get("vertices", []), transform)
+                lens, idx, *lookup = _extract_city_objects(
+                    list(feature.get("CityObjects", {}).items())
+                )
+                yield (lens, idx + n_vertices, *lookup)
+                vertices.append(points)
+                n_vertices += len(points)
+
+        extracted = _merge_extracted(extract_features())
+        return np.concatenate(vertices), extracted
 
     def _load_file(self) -> None:
         """Load and parse the CityJSON file."""
         try:
-            with Path(self.filename).open() as f:
-                self._data = json.load(f)
+            self._data = _json_loads(Path(self.filename).read_bytes())
         except FileNotFoundError as e:
             msg = f"File not found: {self.filename}"
             raise FileNotFoundError(msg) from e
@@ -72,93 +764,118 @@ class CityJSONReader:
             msg = f"Invalid CityJSON file: {self.filename}"
             raise ValueError(msg)
 
-        self._create_mesh()
+    def _extract(self) -> tuple[np.ndarray, tuple]:
+        """Extract vertices and faces from the CityJSON data."""
+        if self._is_seq:
+            return self._extract_seq()
+
+        vertices = _dequantize(
+            self.data.get("vertices", []), self.data.get("transform")
+        )
+        city_objects = list(self.data.get("CityObjects", {}).items())
+        return vertices, _extract_city_objects(city_objects)
 
-    def _create_mesh(self) -> None:
+    def _create_mesh(self) -> pv.PolyData:
         """Convert CityJSON geometries to PyVista mesh."""
-        vertices = np.array(self._data.get("vertices", []))
+        cached = None
+        if self._cache_file is not None:
+            cached = _load_cache(self._cache_file, self._cache_stamp)
+        if cached is not None:
+            vertices, extracted = cached
+        else:
+            vertices, extracted = self._extract()
+            if self._cache_file is not None:
+                _save_cache(self._cache_file, self._cache_stamp, vertices, extracted)
         if len(vertices) == 0:
-            self._mesh = pv.PolyData()
-            return
+            return pv.PolyData()
 
-        # Collect all faces from all city objects
-        all_faces = []
-        cell_data = {"object_type": [], "object_id": []}
+        self._lens, self._idx, type_idx, id_idx, type_names, id_names = extracted
 
-        city_objects = self._data.get("CityObjects", {})
+        if len(self._lens) == 0:
+            return pv.PolyData()
 
-        for obj_id, obj_data in city_objects.items():
-            obj_type = obj_data.get("type", "Unknown")
-            geometries = obj_data.get("geometry", [])
+        if self.optimize:
+            vertices, self._idx = _optimize_vertices(vertices, self._idx)
 
-            for geom in geometries:
-                faces = self._extract_faces_from_geometry(geom)
-                for face in faces:
-                    all_faces.append([len(face), *face])
-                    cell_data["object_type"].append(obj_type)
-                    cell_data["object_id"].append(obj_id)
+        if self.skin:
+            keep = _exterior_faces(self._lens, self._idx)
+            self._idx = self._idx[np.repeat(keep, self._lens)]
+            self._lens = self._lens[keep]
+            type_idx = type_idx[keep]
+            id_idx = id_idx[keep]
 
-        if len(all_faces) == 0:
-            self._mesh = pv.PolyData()
-            return
+        if self.triangulate:
+            self._lens, self._idx, parent = _triangulate(
+                vertices, self._lens, self._idx
+            )
+            type_idx = type_idx[parent]
+            id_idx = id_idx[parent]
 
-        # Create PyVista mesh
-        faces = np.hstack(all_faces)
-        self._mesh = pv.PolyData(vertices, faces)
+        # Create PyVista mesh, keeping the unpacked faces for fast subsetting
+        mesh = _polydata_from_faces(vertices, self._lens, self._idx)
 
         # Add cell data
-        for key, values in cell_data.items():
-            if len(values) > 0:
-                self._mesh.cell_data[key] = values
-
-    def _extract_faces_from_geometry(self, geometry: dict) -> list[list[int]]:
-        """Extract face indices from CityJSON geometry."""
-        geom_type = geometry.get("type", "")
-        boundaries = geometry.get("boundaries", [])
-
-        if geom_type == "Solid":
-            return self._extract_solid_faces(boundaries)
-        if geom_type in {"MultiSurface", "CompositeSurface"}:
-            return self._extract_surface_faces(boundaries)
-        return []
-
-    def _extract_solid_faces(self, boundaries: list) -> list[list[int]]:
-        """Extract faces from Solid geometry."""
-        faces = []
-        for shell in boundaries:
-            for face_def in shell:
-                if isinstance(face_def, list) and len(face_def) > 0:
-                    face = face_def[0] if isinstance(face_def[0], list) else face_def
-                    if self._is_valid_face(face):
-                        faces.append(face)
-        return faces
-
-    def _extract_surface_faces(self, boundaries: list) -> list[list[int]]:
-        """Extract faces from MultiSurface/CompositeSurface geometry."""
-        faces = []
-        for face_def in boundaries:
-            face = (
-                face_def[0]
-                if isinstance(face_def, list) and isinstance(face_def[0], list)
-                else face_def
-            )
-            if self._is_valid_face(face):
-                faces.append(face)
-        return faces
+        self._type_names = np.array(type_names)
+        self._object_ids = np.array(id_names)
+        mesh.cell_data["object_type_idx"] = type_idx
+        # Per-cell type names are only kept for backward compatibility; code
+        # in this module works on the integer indices and never reads them
+        mesh.cell_data["object_type"] = self._type_names[type_idx]
+        mesh.cell_data["object_id"] = id_idx
+        self._add_lookup_tables(mesh)
+        return mesh
+
+    def _add_lookup_tables(self, mesh: pv.PolyData) -> None:
+        """Store the lookup tables indexed by the cell data in the mesh.
+
+        This keeps meshes usable on their own, e.g. the one returned by
+        :func:`read_cityjson`, where the reader is not available.
+        """
+        mesh.field_data["object_types"] = self._type_names
+        mesh.field_data["object_ids"] = self._object_ids
 
-    def _is_valid_face(self, face: list) -> bool:
-        """Check if a face has the minimum required vertices."""
-        min_vertices = 3
-        return len(face) >= min_vertices
+    @cached_property
+    def mesh(self) -> pv.PolyData:
+        """Get the PyVista mesh representation.
+
+        The mesh is built on first access and cached afterwards. Its cell
+        data holds ``object_type_idx``, an int32 index into the object type
+        names, and ``object_type``, the same information as one string per
+        cell, kept for backward compatibility. Prefer ``object_type_idx``
+        for large meshes. ``object_id`` is an int32 index into the city
+        object ids. Both lookup tables are stored in the field data as
+        ``object_types`` and ``object_ids``.
+        """
+        return self._create_mesh()
 
     @property
-    def mesh(self) -> pv.PolyData:
-        """Get the PyVista mesh representation."""
-        return self._mesh
+    def object_ids(self) -> np.ndarray:
+        """Get the city object ids indexed by the ``object_id`` cell data."""
+        # The lookup table is filled in while the mesh is built
+        _ = self.mesh
+        return self._object_ids
+
+    def id_of(self, cell_index: int) -> str:
+        """Get the id of the city object a cell belongs to.
+
+        Parameters
+        ----------
+        cell_index : int
+            Index of a cell in :attr:`mesh`.
+
+        Returns
+        -------
+        str
+            Id of the city object, as used in the ``CityObjects`` mapping.
+
+        """
+        return str(self.object_ids[self.mesh.cell_data["object_id"][cell_index]])
 
     @property
     def data(self) -> dict:
         """Get the raw CityJSON data."""
+        if self._data is None:
+            self._load_file()
         return self._data
 
     def filter_by_type(self, object_type: str) -> pv.PolyData | None:
@@ -175,18 +892,76 @@ class CityJSONReader:
             Filtered mesh containing only objects of the specified type
 
         """
-        if self._mesh is None or "object_type" not in self._mesh.cell_data:
+        mesh = self.mesh
+        if "object_type_idx" not in mesh.cell_data:
             return None
 
-        # Find cells that match the object type
-        cell_mask = np.array(self._mesh.cell_data["object_type"]) == object_type
-
-        if not np.any(cell_mask):
+        # Compare integer type indices rather than strings on every cell
+        (wanted,) = np.nonzero(self._type_names == object_type)
+        if len(wanted) == 0:
+            return None
+        cell_mask = mesh.cell_data["object_type_idx"] == wanted[0]
+        # Objects of this type may have no faces, e.g. a Building whose
+        # geometry is on its BuildingPart children
+        if not cell_mask.any():
             return None
 
-        # Extract matching cells
-        cell_indices = np.where(cell_mask)[0]
-        return self._mesh.extract_cells(cell_indices)
+        # Slice the flat face buffers directly and keep only referenced points
+        lens = self._lens[cell_mask]
+        idx = self._idx[np.repeat(cell_mask, self._lens)]
+        used = np.zeros(mesh.n_points, dtype=bool)
+        used[idx] = True
+        new_ids = np.cumsum(used, dtype=np.int32) - 1
+        filtered = _polydata_from_faces(mesh.points[used], lens, new_ids[idx])
+
+        # Slice the numeric arrays; reading the VTK string array back into
+        # NumPy would cost more than the whole filter
+        type_idx = mesh.cell_data["object_type_idx"][cell_mask]
+        filtered.cell_data["object_type_idx"] = type_idx
+        filtered.cell_data["object_type"] = self._type_names[type_idx]
+        filtered.cell_data["object_id"] = mesh.cell_data["object_id"][cell_mask]
+        self._add_lookup_tables(filtered)
+        return filtered
+
+    def add_to_plotter(
+        self, plotter: pv.Plotter, color_by: str = "object_type", **kwargs: object
+    ) -> pv.Actor:
+        """Add the whole city model to a plotter as a single actor.
+
+        Rendering one mesh colored by cell data is much faster than adding a
+        separate mesh per object type, especially for large city models.
+
+        Parameters
+        ----------
+        plotter : pyvista.Plotter
+            Plotter to add the mesh to.
+        color_by : str, default: "object_type"
+            Cell data array used to color the mesh. Arrays with an
+            integer ``<color_by>_idx`` counterpart are colored by index.
+            ``"object_type"`` and ``"object_id"`` are annotated with the
+            type names and city object ids.
+        **kwargs : dict, optional
+            Additional keyword arguments passed to
+            :meth:`pyvista.Plotter.add_mesh`.
+
+        Returns
+        -------
+        pyvista.Actor
+            Actor of the added mesh.
+
+        """
+        mesh = self.mesh
+        kwargs.setdefault("show_edges", True)
+        if color_by == "object_id":
+            kwargs.setdefault("annotations", dict(enumerate(self._object_ids)))
+        if f"{color_by}_idx" in mesh.cell_data:
+            if color_by == "object_type":
+                kwargs.setdefault("annotations", dict(enumerate(self._type_names)))
+            color_by = f"{color_by}_idx"
+        if color_by in mesh.cell_data:
+            kwargs.setdefault("scalars", color_by)
+            kwargs.setdefault("categories", True)
+        return plotter.add_mesh(mesh, **kwargs)
 
     def color_by_surface(self) -> pv.PolyData | None:
         """Color mesh by semantic surface types.
@@ -199,12 +974,12 @@ class CityJSONReader:
         """
         # This is a simplified implementation
         # In a real implementation, you would parse semantic surface information
-        if self._mesh is None:
-            return None
+        mesh = self.mesh
 
-        # For now, just color by object type
-        if "object_type" in self._mesh.cell_data:
-            return self._mesh.copy()
+        # For now, just color by object type. A shallow copy shares the point,
+        # cell and data arrays with the cached mesh instead of duplicating them.
+        if "object_type" in mesh.cell_data:
+            return mesh.copy(deep=False)
 
         return None
 
@@ -220,7 +995,8 @@ def read_cityjson(filename: str | Path) -> pv.PolyData:
     Returns
     -------
     pyvista.PolyData
-        PyVista mesh representation of the CityJSON data.
+        PyVista mesh representation of the CityJSON data. The
+        ``object_id`` cell data indexes the ``object_ids`` field data.
 
     Raises
     ------
@@ -6,9 +6,9 @@ import pytest
 import pyvista as pv
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def _ensure_pyvista_offscreen():
-    """Ensure PyVista runs in off-screen mode for tests."""
+    """Ensure PyVista runs in off-screen mode for the whole test session."""
     pv.OFF_SCREEN = True
     yield
     pv.OFF_SCREEN = False
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 
+import numpy as np
 import pytest
+import pyvista as pv
 
 from pyvista_cityjson import read_cityjson
+from pyvista_cityjson import reader as reader_module
 from pyvista_cityjson.reader import CityJSONReader
 
 
@@ -67,6 +71,15 @@ def test_reader_initialization(sample_cityjson_file):
     assert reader.mesh is not None
 
 
+def test_mesh_is_built_lazily(sample_cityjson_file):
+    """Test that the mesh is only built on first access and then cached."""
+    reader = CityJSONReader(sample_cityjson_file)
+    assert "mesh" not in vars(reader)
+    assert reader.data["type"] == "CityJSON"
+    assert "mesh" not in vars(reader)
+    assert reader.mesh is reader.mesh
+
+
 def test_invalid_file_format(tmp_path):
     """Test that invalid CityJSON files raise ValueError."""
     invalid_file = tmp_path / "invalid.json"
@@ -89,6 +102,8 @@ def test_mesh_creation(sample_cityjson_file):
     # Check cell data
     assert "object_type" in mesh.cell_data
     assert "object_id" in mesh.cell_data
+    assert mesh.cell_data["object_id"].dtype == np.int32
+    assert reader.id_of(0) == "building1"
 
 
 def test_filter_by_type(sample_cityjson_file):
@@ -99,12 +114,80 @@ def test_filter_by_type(sample_cityjson_file):
     building_mesh = reader.filter_by_type("Building")
     assert building_mesh is not None
     assert building_mesh.n_cells > 0
+    assert building_mesh.field_data["object_ids"].tolist() == ["building1"]
 
     # Filter for non-existent type
     bridge_mesh = reader.filter_by_type("Bridge")
     assert bridge_mesh is None
 
 
+def test_filter_by_type_without_faces(tmp_path):
+    """Test filtering a type whose objects have no faces of their own."""
+    data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],
+        "CityObjects": {
+            "building1": {"type": "Building", "children": ["part1"]},
+            "part1": {
+                "type": "BuildingPart",
+                "parents": ["building1"],
+                "geometry": [{"type": "MultiSurface", "boundaries": [[[0, 1, 2, 3]]]}],
+            },
+        },
+    }
+    file_path = tmp_path / "parts.city.json"
+    with file_path.open("w") as f:
+        json.dump(data, f)
+
+    reader = CityJSONReader(file_path)
+    assert reader.filter_by_type("Building") is None
+    assert reader.filter_by_type("BuildingPart").n_cells == 1
+
+
+def test_filter_by_type_multiple_types(tmp_path):
+    """Test filtering a mesh that contains several object types."""
+    multi_type_data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]],
+        "CityObjects": {
+            "building1": {
+                "type": "Building",
+                "geometry": [
+                    {
+                        "type": "MultiSurface",
+                        "boundaries": [[[0, 1, 2, 3]], [[0, 1, 4]]],
+                    }
+                ],
+            },
+            "bridge1": {
+                "type": "Bridge",
+                "geometry": [{"type": "MultiSurface", "boundaries": [[[1, 2, 4]]]}],
+            },
+        },
+    }
+    file_path = tmp_path / "multi_type.city.json"
+    with file_path.open("w") as f:
+        json.dump(multi_type_data, f)
+
+    reader = CityJSONReader(file_path)
+    assert reader.mesh.cell_data["object_type_idx"].tolist() == [0, 0, 1]
+    assert reader.mesh.cell_data["object_type"].tolist() == [
+        "Building",
+        "Building",
+        "Bridge",
+    ]
+    assert reader.filter_by_type("Building").n_cells == 2
+
+    bridge_mesh = reader.filter_by_type("Bridge")
+    assert isinstance(bridge_mesh, pv.PolyData)
+    assert bridge_mesh.n_cells == 1
+    assert bridge_mesh.n_points == 3
+    assert bridge_mesh.cell_data["object_type"].tolist() == ["Bridge"]
+    assert reader.object_ids[bridge_mesh.cell_data["object_id"]].tolist() == ["bridge1"]
+
+
 def test_empty_cityjson(tmp_path):
     """Test handling of empty CityJSON file."""
     empty_data = {
@@ -143,11 +226,416 @@ def test_multisurface_geometry(tmp_path):
     assert reader.mesh.n_cells == 1
 
 
+def test_solid_inner_rings_are_ignored(tmp_path, sample_cityjson_data):
+    """Test that only the outer ring of each Solid surface becomes a face."""
+    shell = sample_cityjson_data["CityObjects"]["building1"]["geometry"][0][
+        "boundaries"
+    ][0]
+    shell[0] = [[0, 1, 2, 3], [4, 5, 6]]
+    file_path = tmp_path / "holes.city.json"
+    with file_path.open("w") as f:
+        json.dump(sample_cityjson_data, f)
+
+    mesh = CityJSONReader(file_path).mesh
+    assert mesh.n_cells == 6
+    assert mesh.faces[:5].tolist() == [4, 0, 1, 2, 3]
+
+
+def test_transform_is_applied(tmp_path, sample_cityjson_data):
+    """Test that quantized vertices are scaled and translated."""
+    sample_cityjson_data["vertices"] = [
+        [x * 1000, y * 1000, z * 1000] for x, y, z in sample_cityjson_data["vertices"]
+    ]
+    sample_cityjson_data["transform"] = {
+        "scale": [0.001, 0.001, 0.001],
+        "translate": [85000.0, 446000.0, 2.0],
+    }
+    file_path = tmp_path / "transform.city.json"
+    with file_path.open("w") as f:
+        json.dump(sample_cityjson_data, f)
+
+    mesh = CityJSONReader(file_path).mesh
+    assert mesh.points.dtype == np.float64
+    np.testing.assert_allclose(mesh.points[6], [85001.0, 446001.0, 3.0])
+
+
+def test_multisurface_bare_rings(tmp_path):
+    """Test MultiSurface boundaries given as bare rings without nesting."""
+    data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]],
+        "CityObjects": {
+            "surface1": {
+                "type": "Building",
+                "geometry": [
+                    {"type": "MultiSurface", "boundaries": [[0, 1, 2, 3], [0, 1, 4]]}
+                ],
+            }
+        },
+    }
+    file_path = tmp_path / "bare.city.json"
+    with file_path.open("w") as f:
+        json.dump(data, f)
+
+    mesh = CityJSONReader(file_path).mesh
+    assert mesh.faces.tolist() == [4, 0, 1, 2, 3, 3, 0, 1, 4]
+
+
+def test_multisurface_mixed_rings(tmp_path):
+    """Test MultiSurface boundaries mixing nested and bare rings."""
+    data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],
+        "CityObjects": {
+            "surface1": {
+                "type": "Building",
+                "geometry": [
+                    {"type": "MultiSurface", "boundaries": [[[0, 1, 2]], [0, 1, 2, 3]]}
+                ],
+            }
+        },
+    }
+    file_path = tmp_path / "mixed.city.json"
+    with file_path.open("w") as f:
+        json.dump(data, f)
+
+    mesh = CityJSONReader(file_path).mesh
+    assert mesh.n_cells == 2
+    assert mesh.faces.tolist() == [3, 0, 1, 2, 4, 0, 1, 2, 3]
+
+
+def test_mixed_face_sizes(tmp_path):
+    """Test that faces with different vertex counts are packed correctly."""
+    mixed_data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]],
+        "CityObjects": {
+            "surface1": {
+                "type": "Building",
+                "geometry": [
+                    {
+                        "type": "MultiSurface",
+                        "boundaries": [[[0, 1, 4]], [[0, 1, 2, 3]]],
+                    }
+                ],
+            }
+        },
+    }
+    file_path = tmp_path / "mixed.city.json"
+    with file_path.open("w") as f:
+        json.dump(mixed_data, f)
+
+    reader = CityJSONReader(file_path)
+    assert reader.mesh.n_cells == 2
+    assert reader.mesh.faces.tolist() == [3, 0, 1, 4, 4, 0, 1, 2, 3]
+
+
+def test_skin(tmp_path):
+    """Test that faces shared by adjacent solids are dropped on request."""
+    vertices = [[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1, 2)]
+
+    def box(x0):
+        # Vertex index of corner (x, y, z) in the 3 x 2 x 2 grid above
+        v = [[[x0 + x + 3 * y + 6 * z for x in (0, 1)] for y in (0, 1)] for z in (0, 1)]
+        return [
+            [
+                [[v[0][0][0], v[0][1][0], v[0][1][1], v[0][0][1]]],
+                [[v[1][0][0], v[1][0][1], v[1][1][1], v[1][1][0]]],
+                [[v[0][0][0], v[0][0][1], v[1][0][1], v[1][0][0]]],
+                [[v[0][1][0], v[1][1][0], v[1][1][1], v[0][1][1]]],
+                [[v[0][0][0], v[1][0][0], v[1][1][0], v[0][1][0]]],
+                [[v[0][0][1], v[0][1][1], v[1][1][1], v[1][0][1]]],
+            ]
+        ]
+
+    data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": vertices,
+        "CityObjects": {
+            f"building{x0}": {
+                "type": "Building",
+                "geometry": [{"type": "Solid", "boundaries": box(x0)}],
+            }
+            for x0 in (0, 1)
+        },
+    }
+    file_path = tmp_path / "adjacent.city.json"
+    with file_path.open("w") as f:
+        json.dump(data, f)
+
+    assert CityJSONReader(file_path).mesh.n_cells == 12
+    reader = CityJSONReader(file_path, skin=True)
+    mesh = reader.mesh
+    assert mesh.n_cells == 10
+    object_ids = reader.object_ids[mesh.cell_data["object_id"]].tolist()
+    assert object_ids.count("building0") == 5
+
+
+def test_optimize(tmp_path):
+    """Test that vertices are merged and ordered by first use on request."""
+    data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [
+            [5, 5, 5],  # unused
+            [1, 1, 0],
+            [0, 0, 0],
+            [1, 0, 0],
+            [0, 1, 0],
+            [1, 1, 0],  # duplicate of vertex 1
+        ],
+        "CityObjects": {
+            "surface1": {
+                "type": "Building",
+                "geometry": [
+                    {
+                        "type": "MultiSurface",
+                        "boundaries": [[[2, 3, 1]], [[2, 5, 4]]],
+                    }
+                ],
+            }
+        },
+    }
+    file_path = tmp_path / "optimize.city.json"
+    with file_path.open("w") as f:
+        json.dump(data, f)
+
+    original = CityJSONReader(file_path).mesh
+    mesh = CityJSONReader(file_path, optimize=True).mesh
+    assert mesh.n_points == 4
+    assert mesh.faces.tolist() == [3, 0, 1, 2, 3, 0, 2, 3]
+    np.testing.assert_array_equal(
+        mesh.points[mesh.faces.reshape(-1, 4)[:, 1:]],
+        original.points[original.faces.reshape(-1, 4)[:, 1:]],
+    )
+
+
+def test_triangulate_concave(tmp_path):
+    """Test that concave faces are triangulated without covering the notch."""
+    # U-shaped footprint with area 7, starting at the tip of one arm
+    ring = [[1, 3], [0, 3], [0, 0], [3, 0], [3, 3], [2, 3], [2, 1], [1, 1]]
+    data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [[x, y, 0] for x, y in ring],
+        "CityObjects": {
+            "building1": {
+                "type": "Building",
+                "geometry": [
+                    {"type": "MultiSurface", "boundaries": [[list(range(8))]]}
+                ],
+            }
+        },
+    }
+    file_path = tmp_path / "concave.city.json"
+    with file_path.open("w") as f:
+        json.dump(data, f)
+
+    mesh = CityJSONReader(file_path, triangulate=True).mesh
+    assert mesh.is_all_triangles
+    assert mesh.n_cells == 6
+    assert mesh.area == pytest.approx(7.0)
+    assert mesh.cell_data["object_id"].tolist() == [0] * 6
+
+
+def test_triangulate(tmp_path):
+    """Test that polygonal faces are fan-triangulated on request."""
+    polygon_data = {
+        "type": "CityJSON",
+        "version": "1.1",
+        "vertices": [[0, 0, 0], [1, 0, 0], [2, 1, 0], [1, 2, 0], [0, 1, 0]],
+        "CityObjects": {
+            "surface1": {
+                "type": "Building",
+                "geometry": [
+                    {
+                        "type": "MultiSurface",
+                        "boundaries": [[[0, 1, 2]], [[0, 1, 2, 3, 4]]],
+                    }
+                ],
+            }
+        },
+    }
+    file_path = tmp_path / "polygon.city.json"
+    with file_path.open("w") as f:
+        json.dump(polygon_data, f)
+
+    reader = CityJSONReader(file_path, triangulate=True)
+    mesh = reader.mesh
+    assert mesh.is_all_triangles
+    assert mesh.faces.reshape(-1, 4)[:, 1:].tolist() == [
+        [0, 1, 2],
+        [0, 1, 2],
+        [0, 2, 3],
+        [0, 3, 4],
+    ]
+    assert [reader.id_of(i) for i in range(mesh.n_cells)] == ["surface1"] * 4
+    assert reader.filter_by_type("Building").n_cells == 4
+
+
+def test_from_seq(tmp_path, sample_cityjson_data):
+    """Test reading a CityJSONSeq file one feature per line."""
+    header = {
+        "type": "CityJSON",
+        "version": "2.0",
+        "transform": {"scale": [1.0, 1.0, 1.0], "translate": [10.0, 0.0, 0.0]},
+        "vertices": [],
+    }
+    building = sample_cityjson_data["CityObjects"]["building1"]
+    features = [
+        {
+            "type": "CityJSONFeature",
+            "id": feature_id,
+            "CityObjects": {feature_id: building},
+            "vertices": sample_cityjson_data["vertices"],
+        }
+        for feature_id in ("building1", "building2")
+    ]
+    file_path = tmp_path / "test.city.jsonl"
+    with file_path.open("w") as f:
+        for obj in (header, *features):
+            f.write(json.dumps(obj) + "\n")
+
+    reader = CityJSONReader.from_seq(file_path)
+    assert reader.data["type"] == "CityJSON"
+    mesh = reader.mesh
+    assert mesh.n_points == 16
+    assert mesh.n_cells == 12
+    assert mesh.faces[-5:].tolist() == [4, 9, 10, 14, 13]
+    np.testing.assert_allclose(mesh.points[0], [10.0, 0.0, 0.0])
+    assert reader.object_ids.tolist() == ["building1", "building2"]
+    assert mesh.cell_data["object_id"].tolist() == [0] * 6 + [1] * 6
+
+
+def test_from_seq_invalid_feature(tmp_path):
+    """Test that a malformed CityJSONSeq feature raises ValueError."""
+    file_path = tmp_path / "invalid.city.jsonl"
+    with file_path.open("w") as f:
+        f.write(json.dumps({"type": "CityJSON", "version": "2.0"}) + "\n")
+        f.write("This is not valid JSON{\n")
+
+    reader = CityJSONReader.from_seq(file_path)
+    with pytest.raises(ValueError, match="Invalid JSON on line 2"):
+        _ = reader.mesh
+
+
+def test_from_seq_wrong_feature_type(tmp_path):
+    """Test that a CityJSONSeq line that is not a feature raises ValueError."""
+    file_path = tmp_path / "wrong.city.jsonl"
+    with file_path.open("w") as f:
+        f.write(json.dumps({"type": "CityJSON", "version": "2.0"}) + "\n")
+        f.write(json.dumps({"type": "CityJSON"}) + "\n")
+
+    reader = CityJSONReader.from_seq(file_path)
+    msg = f"Invalid CityJSONFeature on line 2: {file_path}"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        _ = reader.mesh
+
+
+def test_cache(sample_cityjson_file, tmp_path, monkeypatch):
+    """Test that extracted geometry is cached until the file changes."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(reader_module, "_cache_dir", lambda: cache_dir)
+
+    parsed = []
+    monkeypatch.setattr(
+        reader_module, "_json_loads", lambda b: parsed.append(b) or json.loads(b)
+    )
+
+    mesh = CityJSONReader(sample_cityjson_file, cache=True).mesh
+    assert len(parsed) == 1
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+
+    reader = CityJSONReader(sample_cityjson_file, cache=True)
+    cached_mesh = reader.mesh
+    assert len(parsed) == 1
+    assert cached_mesh.faces.tolist() == mesh.faces.tolist()
+    assert reader.id_of(5) == "building1"
+    assert reader.data["type"] == "CityJSON"
+    assert len(parsed) == 2
+
+    with sample_cityjson_file.open("a") as f:
+        f.write("\n")
+    assert CityJSONReader(sample_cityjson_file, cache=True).mesh.n_cells == 6
+    assert len(parsed) == 3
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+
+
+def test_cache_corrupt_file(sample_cityjson_file, tmp_path, monkeypatch):
+    """Test that an unreadable cache file falls back to parsing the source."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(reader_module, "_cache_dir", lambda: cache_dir)
+
+    CityJSONReader(sample_cityjson_file, cache=True).mesh  # noqa: B018
+    (cache_file,) = cache_dir.glob("*.npz")
+    cache_file.write_bytes(cache_file.read_bytes()[:100])
+
+    assert CityJSONReader(sample_cityjson_file, cache=True).mesh.n_cells == 6
+    assert CityJSONReader(sample_cityjson_file, cache=True).mesh.n_cells == 6
+
+
+def test_cache_unwritable_dir(sample_cityjson_file, tmp_path, monkeypatch):
+    """Test that a cache directory that cannot be written is ignored."""
+    # A regular file in place of the parent makes creating the directory fail
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(reader_module, "_cache_dir", lambda: blocker / "cache")
+
+    assert CityJSONReader(sample_cityjson_file, cache=True).mesh.n_cells == 6
+    assert CityJSONReader(sample_cityjson_file, cache=True).mesh.n_cells == 6
+
+
+def test_cache_failed_write(sample_cityjson_file, tmp_path, monkeypatch):
+    """Test that a failed cache write leaves no temporary file behind."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(reader_module, "_cache_dir", lambda: cache_dir)
+
+    def savez(file, **arrays: object):  # noqa: ARG001
+        file.write(b"partial")
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(reader_module.np, "savez", savez)
+
+    assert CityJSONReader(sample_cityjson_file, cache=True).mesh.n_cells == 6
+    assert list(cache_dir.iterdir()) == []
+
+
 def test_color_by_surface(sample_cityjson_file):
     """Test color_by_surface method."""
     reader = CityJSONReader(sample_cityjson_file)
     colored_mesh = reader.color_by_surface()
     assert colored_mesh is not None
+    assert colored_mesh is not reader.mesh
+    assert np.shares_memory(colored_mesh.points, reader.mesh.points)
+
+
+def test_add_to_plotter(sample_cityjson_file):
+    """Test that the city model is added to a plotter as one actor."""
+    reader = CityJSONReader(sample_cityjson_file)
+    plotter = pv.Plotter()
+    actor = reader.add_to_plotter(plotter)
+
+    assert [a for a in plotter.actors.values() if isinstance(a, pv.Actor)] == [actor]
+    assert actor.mapper.array_name == "object_type_idx"
+    plotter.close()
+
+
+def test_add_to_plotter_object_id(sample_cityjson_file):
+    """Test coloring the city model by city object."""
+    reader = CityJSONReader(sample_cityjson_file)
+    plotter = pv.Plotter()
+    reader.add_to_plotter(plotter, name="city")
+    actor = reader.add_to_plotter(plotter, color_by="object_id", name="city")
+
+    assert [a for a in plotter.actors.values() if isinstance(a, pv.Actor)] == [actor]
+    assert actor.mapper.array_name == "object_id"
+    assert actor.mapper.lookup_table.annotations == {0: "building1"}
+    assert list(plotter.scalar_bars.keys()) == ["object_id"]
+    plotter.close()
 
 
 def test_read_cityjson_function(sample_cityjson_file):
@@ -162,6 +650,12 @@ def test_read_cityjson_function(sample_cityjson_file):
     assert "object_type" in mesh.cell_data
     assert "object_id" in mesh.cell_data
 
+    # Object ids are resolved through the lookup tables in the field data
+    object_ids = mesh.field_data["object_ids"][mesh.cell_data["object_id"]]
+    assert set(object_ids) == {"building1"}
+    object_types = mesh.field_data["object_types"][mesh.cell_data["object_type_idx"]]
+    assert set(object_types) == {"Building"}
+
 
 def test_read_cityjson_with_pathlib_path(sample_cityjson_file):
     """Test read_cityjson with pathlib.Path input."""